@@ -4,53 +4,103 @@ This module demonstrates optional database usage.
 These endpoints only work when DATABASE_URL is configured.
 """
 
-from fastapi import APIRouter, Depends
-from sqlmodel import Session, select
+from collections.abc import Iterable, Iterator
+
+import orjson
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import RowMapping, bindparam, select
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, col
 
 from app.core.database import get_session
-from app.core.db_utils import get_by_id_or_404
+from app.core.db_utils import exists_by_field, get_by_id_or_404
 from app.core.exceptions import bad_request_exception
-from app.models.user import User
+from app.models.user import User, UserRead
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# Serializes users straight to JSON bytes; the handlers return already-typed
+# users, so FastAPI's response_model validation pass is skipped
+_USER_ADAPTER = TypeAdapter(User)
+
 
 @router.post("/", response_model=User, status_code=201)
-def create_user(user: User, session: Session = Depends(get_session)) -> User:
+def create_user(user: User, session: Session = Depends(get_session)) -> Response:
     """Create a new user.
 
     Raises:
         HTTPException: If user with email or username already exists.
     """
-    # Check if user already exists
-    statement = select(User).where(
-        (User.email == user.email) | (User.username == user.username)
-    )
-    existing = session.exec(statement).first()
-    if existing:
-        raise bad_request_exception("User with this email or username already exists")
-
+    # Rely on the unique email/username constraints instead of a pre-check query
     session.add(user)
-    session.commit()
-    session.refresh(user)
-    return user
+    try:
+        session.commit()
+    except IntegrityError:
+        session.rollback()
+        # Only duplicates are the client's fault; other violations stay errors
+        if exists_by_field(session, User, "email", user.email) or exists_by_field(
+            session, User, "username", user.username
+        ):
+            raise bad_request_exception(
+                "User with this email or username already exists"
+            ) from None
+        raise
+    # No refresh: sessions keep attributes after commit and the flush set the ID
+    return Response(
+        _USER_ADAPTER.dump_json(user), status_code=201, media_type="application/json"
+    )
 
 
 @router.get("/{user_id}", response_model=User)
-def get_user(user_id: int, session: Session = Depends(get_session)) -> User:
+def get_user(user_id: int, session: Session = Depends(get_session)) -> Response:
     """Get user by ID.
 
     Raises:
         HTTPException: If user not found.
     """
-    return get_by_id_or_404(session, User, user_id, "User")
+    user = get_by_id_or_404(session, User, user_id, "User")
+    return Response(_USER_ADAPTER.dump_json(user), media_type="application/json")
+
 
+# Keyset page query, built once and executed with cursor/limit parameters.
+# Selects the UserRead columns so no ORM instance is built per row, and
+# fetches in batches through a server-side cursor where the driver has one.
+_LIST_USERS_STATEMENT = (
+    select(*(getattr(User, name) for name in UserRead.model_fields))
+    .where(col(User.id) > bindparam("cursor"))
+    .order_by(col(User.id))
+    .limit(bindparam("limit"))
+    .execution_options(yield_per=200)
+)
 
-@router.get("/", response_model=list[User])
+
+def _stream_users(rows: Iterable[RowMapping]) -> Iterator[bytes]:
+    """Serialize user rows as a JSON array one row at a time."""
+    yield b"["
+    separator = b""
+    for row in rows:
+        yield separator + orjson.dumps(dict(row))
+        separator = b","
+    yield b"]"
+
+
+@router.get("/", response_model=list[UserRead])
 def list_users(
-    skip: int = 0, limit: int = 100, session: Session = Depends(get_session)
-) -> list[User]:
-    """List all users with pagination."""
-    statement = select(User).offset(skip).limit(limit)
-    users = session.exec(statement).all()
-    return list(users)
+    cursor: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
+    session: Session = Depends(get_session),
+) -> StreamingResponse:
+    """List users with keyset pagination.
+
+    Returns users with an ID greater than `cursor`, ordered by ID.
+    Pass the last ID of a page as the `cursor` for the next page.
+    `limit` is capped at 500 users per page.
+    """
+    rows = (
+        session.connection()
+        .execute(_LIST_USERS_STATEMENT, {"cursor": cursor, "limit": limit})
+        .mappings()
+    )
+    return StreamingResponse(_stream_users(rows), media_type="application/json")
@@ -3,10 +3,12 @@
 Provides bearer token-based authentication via Authorization header.
 """
 
+import hashlib
 from typing import Annotated
 
-from fastapi import Depends
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import Depends, Request
+from fastapi.openapi.models import HTTPBearer as HTTPBearerModel
+from fastapi.security.base import SecurityBase
 
 from app.core.env import get_env_list
 from app.core.exceptions import (
@@ -15,21 +17,67 @@ from app.core.exceptions import (
     unauthorized_exception,
 )
 
+
+class BearerTokenScheme(SecurityBase):
+    """Bearer token security scheme that returns the raw token.
+
+    Parses the Authorization header directly instead of building an
+    HTTPAuthorizationCredentials model per request, while still registering
+    the HTTP bearer scheme in the OpenAPI schema.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the OpenAPI security scheme model."""
+        self.model = HTTPBearerModel()
+        self.scheme_name = "HTTPBearer"
+
+    async def __call__(self, request: Request) -> str | None:
+        """Extract the bearer token from the Authorization header.
+
+        Args:
+            request: Incoming request.
+
+        Returns:
+            The token, or None if the header is missing or not a bearer token.
+        """
+        authorization = request.headers.get("authorization")
+        if not authorization:
+            return None
+
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return None
+
+        return token
+
+
 # Bearer token security scheme
-bearer_scheme = HTTPBearer(auto_error=False)
+bearer_scheme = BearerTokenScheme()
+
+
+def hash_api_key(token: str) -> bytes:
+    """Hash an API token for constant-size lookup.
+
+    Args:
+        token: Raw bearer token.
+
+    Returns:
+        SHA-256 digest of the token.
+    """
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
 
 # Load API tokens from environment
 # Supports multiple tokens separated by commas
-VALID_API_KEYS = set(get_env_list("API_KEYS"))
+# Only digests are kept so lookups never compare raw token strings
+VALID_API_KEY_HASHES = frozenset(hash_api_key(t) for t in get_env_list("API_KEYS"))
 
 
-def get_api_token(
-    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
-) -> str:
+def get_api_token(token: str | None = Depends(bearer_scheme)) -> str:
     """Validate bearer token from Authorization header.
 
     Args:
-        credentials: Bearer token credentials from Authorization header.
+        token: Bearer token from Authorization header.
 
     Returns:
         The validated token.
@@ -38,16 +86,16 @@ def get_api_token(
         HTTPException: If token is missing or invalid.
     """
     # If no tokens are configured, authentication is disabled
-    if not VALID_API_KEYS:
+    if not VALID_API_KEY_HASHES:
         raise internal_server_exception("Bearer token authentication is not configured")
 
-    if not credentials:
+    if not token:
         raise unauthorized_exception("Missing bearer token")
 
-    if credentials.credentials not in VALID_API_KEYS:
+    if hash_api_key(token) not in VALID_API_KEY_HASHES:
         raise forbidden_exception("Invalid bearer token")
 
-    return credentials.credentials
+    return token
 
 
 # Type alias for dependency injection
@@ -60,4 +108,4 @@ def is_auth_enabled() -> bool:
     Returns:
         True if tokens are configured, False otherwise.
     """
-    return bool(VALID_API_KEYS)
+    return bool(VALID_API_KEY_HASHES)
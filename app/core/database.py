@@ -4,8 +4,11 @@ Database is enabled when DATABASE_URL environment variable is set.
 """
 
 from collections.abc import Generator
+from typing import Any
 
 from sqlalchemy import Engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool, QueuePool
 from sqlmodel import Session, SQLModel, create_engine
 
 from app.core.env import get_env_bool, get_env_str
@@ -14,21 +17,43 @@ from app.core.exceptions import internal_server_exception
 # Optional: Get database URL from environment
 DATABASE_URL = get_env_str("DATABASE_URL")
 
+# Connection pool capacity for non-SQLite databases
+POOL_SIZE = 20
+MAX_OVERFLOW = 40
+
 # Database is optional - only initialize if DATABASE_URL is set
 engine: Engine | None = None
 if DATABASE_URL:  # pragma: no cover
     # Create engine with appropriate settings
     connect_args = {}
+    pool_args: dict[str, Any] = {}
     if DATABASE_URL.startswith("sqlite"):
         # SQLite-specific settings
         connect_args = {"check_same_thread": False}
+    elif get_env_bool("DATABASE_NULL_POOL"):
+        # An external pooler (e.g. PgBouncer) already pools connections
+        pool_args = {"poolclass": NullPool}
+    else:
+        # Size the connection pool for concurrent requests
+        pool_args = {
+            "pool_size": POOL_SIZE,
+            "max_overflow": MAX_OVERFLOW,
+            "pool_timeout": 30,
+            "pool_pre_ping": True,
+            "pool_recycle": 3600,
+        }
 
     engine = create_engine(
         DATABASE_URL,
         echo=get_env_bool("DATABASE_ECHO"),
         connect_args=connect_args,
+        **pool_args,
     )
 
+# Session factory; the engine is bound per call so it can be swapped at runtime
+# Skip autoflush and keep attributes loaded after commit to avoid extra queries
+SessionLocal = sessionmaker(class_=Session, autoflush=False, expire_on_commit=False)
+
 
 def create_db_and_tables() -> None:
     """Create database tables if database is enabled."""
@@ -36,6 +61,25 @@ def create_db_and_tables() -> None:
         SQLModel.metadata.create_all(engine)
 
 
+def get_pool_capacity(db_engine: Engine) -> int | None:
+    """Get how many connections the engine's pool can hand out at once.
+
+    Args:
+        db_engine: Engine whose pool to inspect.
+
+    Returns:
+        Pool size plus overflow for a bounded QueuePool, otherwise None.
+    """
+    pool = db_engine.pool
+    if not isinstance(pool, QueuePool):
+        return None
+    # QueuePool has no public accessor for its overflow limit
+    max_overflow: int = pool._max_overflow  # pyright: ignore[reportPrivateUsage]
+    if max_overflow < 0:
+        return None
+    return pool.size() + max_overflow
+
+
 def get_session() -> Generator[Session, None, None]:
     """Dependency to get database session.
 
@@ -50,5 +94,5 @@ def get_session() -> Generator[Session, None, None]:
             "Database not configured. Set DATABASE_URL environment variable."
         )
 
-    with Session(engine) as session:
+    with SessionLocal(bind=engine) as session:
         yield session
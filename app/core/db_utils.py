@@ -2,6 +2,7 @@
 
 from typing import Any, TypeVar
 
+from sqlalchemy import exists
 from sqlmodel import Session, SQLModel, select
 
 from app.core.exceptions import not_found_exception
@@ -62,6 +63,6 @@ def exists_by_field(
         email_exists = exists_by_field(session, User, "email", "test@example.com")
     """
     field = getattr(model, field_name)
-    statement = select(model).where(field == value)
-    result = session.exec(statement).first()
-    return result is not None
+    # SELECT EXISTS(...) returns a single boolean without loading a row
+    statement = select(exists().where(field == value))
+    return session.exec(statement).one()
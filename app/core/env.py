@@ -1,8 +1,14 @@
-"""Environment variable utilities for type-safe configuration."""
+"""Environment variable utilities for type-safe configuration.
+
+Lookups are cached per process since configuration is immutable after startup.
+Call clear_env_cache() after mutating os.environ (e.g., in tests).
+"""
 
 import os
+from functools import cache
 
 
+@cache
 def get_env_bool(key: str, default: bool = False) -> bool:
     """
     Get a boolean environment variable.
@@ -24,6 +30,7 @@ def get_env_bool(key: str, default: bool = False) -> bool:
     return value == "true"
 
 
+@cache
 def get_env_str(key: str, default: str = "") -> str:
     """
     Get a string environment variable.
@@ -60,11 +67,31 @@ def get_env_list(
         tokens = get_env_list("API_KEYS")
         allowed_hosts = get_env_list("ALLOWED_HOSTS", separator=";")
     """
-    if default is None:
-        default = []
+    items = _parse_env_list(key, separator)
+    if items is None:
+        return [] if default is None else default
+
+    return list(items)
+
 
+@cache
+def _parse_env_list(key: str, separator: str) -> tuple[str, ...] | None:
+    """Split a delimited environment variable, or return None if not set."""
     value = os.getenv(key, "")
     if not value:
-        return default
+        return None
+
+    return tuple(item.strip() for item in value.split(separator) if item.strip())
 
-    return [item.strip() for item in value.split(separator) if item.strip()]
+
+def clear_env_cache() -> None:
+    """
+    Clear cached environment variable lookups.
+
+    Example:
+        os.environ["LOG_LEVEL"] = "DEBUG"
+        clear_env_cache()
+    """
+    get_env_bool.cache_clear()
+    get_env_str.cache_clear()
+    _parse_env_list.cache_clear()
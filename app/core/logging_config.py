@@ -3,13 +3,14 @@
 Provides standardized JSON logging setup with configurable log levels.
 """
 
-import json
 import logging
 import sys
 import traceback
 from datetime import datetime, timezone
 from typing import Any
 
+import orjson
+
 from app.core.env import get_env_str
 
 
@@ -26,9 +27,8 @@ class JSONFormatter(logging.Formatter):
             JSON-formatted log string.
         """
         log_data: dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(
-                record.created, tz=timezone.utc
-            ).isoformat(),
+            # orjson serializes datetimes natively in ISO 8601 format
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -49,7 +49,13 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "extra_fields"):
             log_data.update(record.extra_fields)  # type: ignore
 
-        return json.dumps(log_data)
+        # OPT_NON_STR_KEYS matches json.dumps for non-string keys in extra fields
+        return orjson.dumps(log_data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Single stdout handler reused by every setup_logging() call
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(JSONFormatter())
 
 
 def setup_logging() -> logging.Logger:
@@ -58,23 +64,19 @@ def setup_logging() -> logging.Logger:
     Log level can be controlled via LOG_LEVEL environment variable.
     Defaults to INFO.
 
+    Safe to call more than once: the root logger is reset to a single shared
+    JSON handler, replacing any handlers installed elsewhere (e.g., Uvicorn).
+
     Returns:
         Configured logger instance.
     """
     log_level = get_env_str("LOG_LEVEL", "INFO").upper()
 
-    # Create JSON formatter
-    json_formatter = JSONFormatter()
-
-    # Configure handler
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(json_formatter)
-
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+    root_logger.addHandler(_handler)
 
     # Get application logger
     logger = logging.getLogger("app")
@@ -93,7 +95,3 @@ def get_logger(name: str) -> logging.Logger:
         Logger instance.
     """
     return logging.getLogger(f"app.{name}")
-
-
-# Create the main application logger
-logger = setup_logging()
@@ -1,13 +1,30 @@
-"""Project metadata loaded from pyproject.toml."""
+"""Project metadata loaded from the installed distribution or pyproject.toml."""
 
+from importlib.metadata import PackageNotFoundError, metadata
 from pathlib import Path
 
 from tomllib import load
 
-# Load project metadata from pyproject.toml
-_pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
-with open(_pyproject_path, "rb") as _f:
-    _pyproject = load(_f)
-    PROJECT_NAME: str = _pyproject["project"]["name"]
-    PROJECT_VERSION: str = _pyproject["project"]["version"]
-    PROJECT_DESCRIPTION: str = _pyproject["project"]["description"]
+_DISTRIBUTION_NAME = "python-microservice-template"
+
+
+def _load_metadata() -> tuple[str, str, str]:
+    """Load the project name, version, and description.
+
+    Reads the installed distribution metadata when available, falling back
+    to parsing pyproject.toml (e.g., when running from a source checkout).
+
+    Returns:
+        Tuple of (name, version, description).
+    """
+    try:
+        dist = metadata(_DISTRIBUTION_NAME)
+        return dist["Name"], dist["Version"], dist["Summary"]
+    except PackageNotFoundError:
+        pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
+        with open(pyproject_path, "rb") as f:
+            project = load(f)["project"]
+        return project["name"], project["version"], project["description"]
+
+
+PROJECT_NAME, PROJECT_VERSION, PROJECT_DESCRIPTION = _load_metadata()
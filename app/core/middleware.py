@@ -0,0 +1,56 @@
+"""ASGI middleware for the application.
+
+Implemented as pure ASGI middleware to avoid the per-request Request/Response
+construction and extra task that BaseHTTPMiddleware adds.
+"""
+
+import logging
+from collections.abc import Iterable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class RequestLoggingMiddleware:
+    """Log HTTP requests and their response status codes."""
+
+    def __init__(self, app: ASGIApp, excluded_paths: Iterable[str] = ()) -> None:
+        """Wrap an ASGI application.
+
+        Args:
+            app: ASGI application to wrap.
+            excluded_paths: Request paths that are never logged.
+        """
+        self.app = app
+        self.excluded_paths = frozenset(excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Log the request, then the status once the response starts.
+
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive channel.
+            send: ASGI send channel.
+        """
+        # Skip wrapping send entirely when INFO records would be dropped
+        if scope["type"] != "http" or not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        logger.info("%s %s", method, path)
+
+        async def send_with_logging(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                logger.info("%s %s - Status: %s", method, path, message["status"])
+            await send(message)
+
+        await self.app(scope, receive, send_with_logging)
@@ -19,6 +19,10 @@ from app.core.metadata import PROJECT_NAME
 
 logger = get_logger(__name__)
 
+# URL regexes the FastAPI instrumentor skips: the healthcheck probed at "/" and
+# the API docs. Matched against the full URL without query string.
+EXCLUDED_URLS = r"://[^/]+/((docs|redoc|openapi\.json)(/.*)?)?$"
+
 
 def is_otel_enabled() -> bool:
     """Check if OpenTelemetry is enabled via environment variable.
@@ -50,6 +54,20 @@ def get_otel_endpoint() -> str | None:
     return endpoint if endpoint else None
 
 
+def get_excluded_urls() -> str | None:
+    """Get the URLs the FastAPI instrumentor should not trace.
+
+    Returns:
+        None if OTEL_PYTHON_FASTAPI_EXCLUDED_URLS or OTEL_PYTHON_EXCLUDED_URLS
+        is set, so the instrumentor reads them itself, otherwise EXCLUDED_URLS.
+    """
+    if get_env_str("OTEL_PYTHON_FASTAPI_EXCLUDED_URLS") or get_env_str(
+        "OTEL_PYTHON_EXCLUDED_URLS"
+    ):
+        return None
+    return EXCLUDED_URLS
+
+
 def setup_opentelemetry() -> None:
     """Initialize OpenTelemetry instrumentation.
 
@@ -69,12 +87,13 @@ def setup_opentelemetry() -> None:
         return
 
     service_name = get_service_name()
-    logger.info(f"Initializing OpenTelemetry for service: {service_name}")
+    logger.info("Initializing OpenTelemetry for service: %s", service_name)
 
     # Create resource with service name
     resource = Resource.create({"service.name": service_name})
 
-    # Set up tracing
+    # Set up tracing; sampling and batching follow the standard
+    # OTEL_TRACES_SAMPLER* and OTEL_BSP_* environment variables
     trace_provider = TracerProvider(resource=resource)
     trace_exporter = OTLPSpanExporter(endpoint=endpoint)
     trace_provider.add_span_processor(BatchSpanProcessor(trace_exporter))
@@ -85,4 +104,4 @@ def setup_opentelemetry() -> None:
     meter_provider = MeterProvider(resource=resource, metric_readers=[metric_reader])
     metrics.set_meter_provider(meter_provider)
 
-    logger.info(f"OpenTelemetry initialized with endpoint: {endpoint}")
+    logger.info("OpenTelemetry initialized with endpoint: %s", endpoint)
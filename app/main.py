@@ -1,34 +1,52 @@
-from collections.abc import AsyncGenerator, Awaitable, Callable
+from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, Response
+from anyio import to_thread
+from fastapi import FastAPI
 from opentelemetry.instrumentation.fastapi import (  # pyright: ignore[reportMissingTypeStubs]
     FastAPIInstrumentor,
 )
 
 from app.api.routes.healthcheck import router as healthcheck_router
 from app.api.routes.v1 import router as v1_router
-from app.core.database import create_db_and_tables, engine
-from app.core.logging_config import get_logger
+from app.core.auth import is_auth_enabled
+from app.core.database import create_db_and_tables, engine, get_pool_capacity
+from app.core.logging_config import get_logger, setup_logging
 from app.core.metadata import PROJECT_DESCRIPTION, PROJECT_NAME, PROJECT_VERSION
-from app.core.otel import is_otel_enabled, setup_opentelemetry
+from app.core.middleware import RequestLoggingMiddleware
+from app.core.otel import get_excluded_urls, is_otel_enabled, setup_opentelemetry
 
 logger = get_logger(__name__)
 
 
 @asynccontextmanager
-async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+async def lifespan(application: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler.
 
-    Sets up OpenTelemetry and creates database tables on startup if configured.
+    Sets up logging and OpenTelemetry, creates database tables on startup
+    if configured, and builds the OpenAPI schema ahead of the first request.
     """
+    # Startup: Configure logging before anything is logged
+    setup_logging()
     logger.info("Application startup")
+    if is_auth_enabled():  # pragma: no cover
+        logger.info("Authentication enabled, protected routes included")
+    if is_otel_enabled():  # pragma: no cover
+        logger.info("OpenTelemetry enabled, FastAPI instrumented")
     # Startup: Initialize OpenTelemetry if enabled
     setup_opentelemetry()
     # Startup: Create database tables if database is enabled
     if engine is not None:  # pragma: no cover
-        logger.info("Database enabled, creating tables")
+        logger.info("Database enabled, user routes included, creating tables")
         create_db_and_tables()
+    # Sync path operations run in the threadpool; allow one thread per
+    # pooled connection so concurrency is capped by the database, not AnyIO
+    pool_capacity = get_pool_capacity(engine) if engine is not None else None
+    if pool_capacity is not None:
+        limiter = to_thread.current_default_thread_limiter()
+        limiter.total_tokens = max(limiter.total_tokens, pool_capacity)
+    # Startup: Build and cache the OpenAPI schema instead of on the first /docs hit
+    application.openapi()
     yield
     # Shutdown: Add cleanup code here if needed
     logger.info("Application shutdown")
@@ -43,19 +61,11 @@ app = FastAPI(
 
 # Optional: Instrument FastAPI with OpenTelemetry if enabled
 if is_otel_enabled():  # pragma: no cover
-    logger.info("OpenTelemetry enabled, instrumenting FastAPI")
-    FastAPIInstrumentor.instrument_app(app)
-
-
-@app.middleware("http")
-async def log_requests(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
-    """Log all HTTP requests."""
-    logger.info(f"{request.method} {request.url.path}")
-    response = await call_next(request)
-    logger.info(f"{request.method} {request.url.path} - Status: {response.status_code}")
-    return response
+    FastAPIInstrumentor.instrument_app(app, excluded_urls=get_excluded_urls())
+
+
+# Skip logging healthcheck probes
+app.add_middleware(RequestLoggingMiddleware, excluded_paths={"/"})
 
 
 app.include_router(healthcheck_router)
@@ -1,6 +1,15 @@
 """Database models.
 
 Example SQLModel models for the application.
+
+To-many relationships should load with "selectin" by default so listing N rows
+costs 2 queries instead of 1 + N lazy loads, for example:
+
+    roles: list["Role"] = Relationship(
+        back_populates="users", sa_relationship_kwargs={"lazy": "selectin"}
+    )
+
+Use select(User).options(selectinload(User.roles)) to opt in per query instead.
 """
 
 from sqlmodel import Field, SQLModel
@@ -14,3 +23,14 @@ class User(SQLModel, table=True):
     username: str = Field(index=True, unique=True)
     full_name: str | None = None
     is_active: bool = Field(default=True)
+
+
+# Plain columns without ORM state, so list rows serialize without a User each
+class UserRead(SQLModel):
+    """User response model example."""
+
+    id: int
+    email: str
+    username: str
+    full_name: str | None = None
+    is_active: bool = True
@@ -2,9 +2,9 @@
 PYTHONPATH=. uv run scripts/generate_openapi.py
 """
 
-import json
+import orjson
 
 from app.main import app
 
-with open("openapi.json", "w") as f:
-    json.dump(app.openapi(), f, indent=2)
+with open("openapi.json", "wb") as f:
+    f.write(orjson.dumps(app.openapi(), option=orjson.OPT_INDENT_2))
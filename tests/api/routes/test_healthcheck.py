@@ -6,3 +6,11 @@ def test_read_healthcheck(client: TestClient) -> None:
     assert response.status_code == 200
     content = response.json()
     assert content["status"] == "ok"
+
+
+def test_healthcheck_response_schema(client: TestClient) -> None:
+    response = client.get("/openapi.json")
+    schema = response.json()["paths"]["/"]["get"]["responses"]["200"]
+    content_schema = schema["content"]["application/json"]["schema"]
+    assert content_schema["type"] == "object"
+    assert content_schema["additionalProperties"] == {"type": "string"}
@@ -1,12 +1,31 @@
 """Tests for user endpoints."""
 
 from collections.abc import Generator
+from typing import Any
 
+import orjson
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from httpx import Response
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session
 
-from tests.utils.app_factory import create_test_app_with_database
+from app.core.database import get_session
+from app.models.user import User, UserRead
+
+# Request body for a single test user; responses echo it back with an ID
+TEST_USER = {
+    "email": "test@example.com",
+    "username": "testuser",
+    "full_name": "Test User",
+    "is_active": True,
+}
+
+
+def read_json(response: Response) -> Any:
+    """Decode a JSON response body with orjson."""
+    return orjson.loads(response.content)
 
 
 def create_test_user(
@@ -37,41 +56,64 @@ def create_test_user(
             "is_active": is_active,
         },
     )
-    return response.json()
+    return read_json(response)
 
 
-@pytest.fixture
-def client_with_db(db_session: Session) -> Generator[TestClient, None, None]:
-    """Test client with database enabled."""
-    from app.api.routes.v1 import users
+def seed_test_users(session: Session, prefix: str, count: int) -> None:
+    """Helper function to insert test users in a single commit.
 
-    # Create test app with database and users router
-    test_app = create_test_app_with_database(
-        db_session, include_routers=[(users.router, {"prefix": "/v1"})]
+    Args:
+        session: Database session shared with the test client
+        prefix: Prefix for each user's email, username and full name
+        count: Number of users to insert
+    """
+    session.add_all(
+        User(
+            email=f"{prefix}{i}@example.com",
+            username=f"{prefix}user{i}",
+            full_name=f"{prefix} user {i}",
+        )
+        for i in range(count)
     )
+    session.commit()
 
-    yield TestClient(test_app)
-    test_app.dependency_overrides.clear()
+
+@pytest.fixture(scope="module")
+def users_app() -> FastAPI:
+    """Test app with the users router, built once per module."""
+    from app.api.routes.v1 import users
+
+    app = FastAPI()
+    app.include_router(users.router, prefix="/v1")
+    # Build the OpenAPI schema up front, as the main app's lifespan does
+    app.openapi()
+    return app
+
+
+@pytest.fixture(scope="module")
+def users_client(users_app: FastAPI) -> Generator[TestClient, None, None]:
+    """Test client shared across the module."""
+    with TestClient(users_app) as client:
+        yield client
+
+
+@pytest.fixture
+def client_with_db(
+    users_app: FastAPI, users_client: TestClient, db_session: Session
+) -> Generator[TestClient, None, None]:
+    """Test client with database enabled."""
+    users_app.dependency_overrides[get_session] = lambda: db_session
+    yield users_client
+    users_app.dependency_overrides.clear()
 
 
 def test_create_user(client_with_db: TestClient) -> None:
     """Test creating a new user."""
-    response = client_with_db.post(
-        "/v1/users/",
-        json={
-            "email": "test@example.com",
-            "username": "testuser",
-            "full_name": "Test User",
-            "is_active": True,
-        },
-    )
+    response = client_with_db.post("/v1/users/", json=TEST_USER)
     assert response.status_code == 201
-    data = response.json()
-    assert data["email"] == "test@example.com"
-    assert data["username"] == "testuser"
-    assert data["full_name"] == "Test User"
-    assert data["is_active"] is True
-    assert "id" in data
+    data = read_json(response)
+    assert isinstance(data["id"], int)
+    assert data == {"id": data["id"], **TEST_USER}
 
 
 @pytest.mark.parametrize(
@@ -105,7 +147,13 @@ def test_create_duplicate_user(
         },
     )
     assert response.status_code == 400
-    assert "already exists" in response.json()["detail"]
+    assert "already exists" in read_json(response)["detail"]
+
+
+def test_create_user_other_integrity_error(client_with_db: TestClient) -> None:
+    """Test that non-duplicate constraint failures are not reported as 400."""
+    with pytest.raises(IntegrityError):
+        client_with_db.post("/v1/users/", json={"email": "nousername@example.com"})
 
 
 def test_get_user(client_with_db: TestClient) -> None:
@@ -119,45 +167,59 @@ def test_get_user(client_with_db: TestClient) -> None:
     # Get user
     response = client_with_db.get(f"/v1/users/{user_id}")
     assert response.status_code == 200
-    data = response.json()
-    assert data["id"] == user_id
-    assert data["email"] == "getuser@example.com"
+    assert read_json(response) == user_data
 
 
 def test_get_nonexistent_user(client_with_db: TestClient) -> None:
     """Test getting a user that doesn't exist."""
     response = client_with_db.get("/v1/users/99999")
     assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
+    assert "not found" in read_json(response)["detail"].lower()
 
 
-def test_list_users(client_with_db: TestClient) -> None:
+def test_list_users(client_with_db: TestClient, db_session: Session) -> None:
     """Test listing all users."""
     # Create multiple users
-    for i in range(1, 4):
-        create_test_user(
-            client_with_db, f"user{i}@example.com", f"user{i}", f"User {i}"
-        )
+    seed_test_users(db_session, "list", 3)
 
     # List users
     response = client_with_db.get("/v1/users/")
     assert response.status_code == 200
-    data: list[dict[str, object]] = response.json()
+    data: list[dict[str, object]] = read_json(response)
     assert isinstance(data, list)
     assert len(data) >= 3
+    assert list(data[0]) == list(UserRead.model_fields)
 
 
-def test_list_users_with_pagination(client_with_db: TestClient) -> None:
+def test_list_users_with_pagination(
+    client_with_db: TestClient, db_session: Session
+) -> None:
     """Test listing users with pagination."""
     # Create multiple users
-    for i in range(5):
-        create_test_user(
-            client_with_db, f"page{i}@example.com", f"pageuser{i}", f"Page User {i}"
-        )
+    seed_test_users(db_session, "page", 5)
+
+    all_ids = [user["id"] for user in read_json(client_with_db.get("/v1/users/"))]
 
-    # Test skip and limit
-    response = client_with_db.get("/v1/users/?skip=2&limit=2")
+    # Test first page
+    response = client_with_db.get("/v1/users/?limit=2")
     assert response.status_code == 200
-    data: list[dict[str, object]] = response.json()
-    assert isinstance(data, list)
-    assert len(data) == 2
+    first_page: list[dict[str, object]] = read_json(response)
+    assert [user["id"] for user in first_page] == all_ids[:2]
+
+    # Test next page starts after the last ID of the first page
+    cursor = first_page[-1]["id"]
+    response = client_with_db.get(f"/v1/users/?cursor={cursor}&limit=2")
+    assert response.status_code == 200
+    second_page: list[dict[str, object]] = read_json(response)
+    assert [user["id"] for user in second_page] == all_ids[2:4]
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["cursor=-1", "limit=0", "limit=501"],
+    ids=["negative_cursor", "zero_limit", "limit_above_max"],
+)
+def test_list_users_invalid_pagination(client_with_db: TestClient, query: str) -> None:
+    """Test that out-of-range pagination parameters are rejected."""
+    response = client_with_db.get(f"/v1/users/?{query}")
+    assert response.status_code == 422
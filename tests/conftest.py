@@ -2,24 +2,23 @@ from collections.abc import Generator
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import Engine
 from sqlmodel import Session, SQLModel
 
 from app.main import app
-from tests.utils.database import create_test_engine
+from tests.utils.database import create_test_engine, transactional_test_session
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def client() -> Generator[TestClient, None, None]:
+    """Test client for the main app, started once per test session."""
     with TestClient(app) as c:
         yield c
 
 
-@pytest.fixture(scope="function", autouse=False)
-def db_session() -> Generator[Session, None, None]:
-    """Create a test database session.
-
-    Creates a new in-memory database for each test function.
-    """
+@pytest.fixture(scope="session")
+def db_engine() -> Generator[Engine, None, None]:
+    """Create the in-memory test database once per test session."""
     # Import models to ensure they're registered
     from app.models import user  # noqa: F401, F811  # type: ignore[reportUnusedImport]
 
@@ -29,8 +28,18 @@ def db_session() -> Generator[Session, None, None]:
     # Create all tables
     SQLModel.metadata.create_all(engine)
 
-    with Session(engine) as session:
-        yield session
+    yield engine
 
     # Clean up
     engine.dispose()
+
+
+@pytest.fixture(scope="function", autouse=False)
+def db_session(db_engine: Engine) -> Generator[Session, None, None]:
+    """Create a test database session.
+
+    Runs each test function inside a transaction that is rolled back on
+    teardown. Commits in the code under test only release a SAVEPOINT.
+    """
+    with transactional_test_session(db_engine) as session:
+        yield session
@@ -138,3 +138,48 @@ def test_is_auth_enabled() -> None:
     # Test without tokens
     with temporary_valid_tokens(auth, None):
         assert auth.is_auth_enabled() is False
+
+
+def test_valid_tokens_stored_as_hashes() -> None:
+    """Test that configured tokens are stored as SHA-256 digests."""
+    from app.core import auth
+
+    with temporary_valid_tokens(auth, {"test-token"}):
+        assert auth.VALID_API_KEY_HASHES == {auth.hash_api_key("test-token")}
+        assert len(auth.hash_api_key("test-token")) == 32
+
+
+def test_rejections_are_not_shared() -> None:
+    """Test that each rejection raises its own exception instance.
+
+    The dependency runs in the threadpool, so a shared instance would have its
+    traceback and context overwritten by concurrent requests.
+    """
+    from app.core import auth
+
+    with temporary_valid_tokens(auth, {"test-token"}):
+        raised: list[HTTPException] = []
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                auth.get_api_token(None)
+            assert exc_info.value.status_code == 401
+            raised.append(exc_info.value)
+
+        assert raised[0] is not raised[1]
+
+
+def test_protected_endpoint_with_lowercase_scheme(client_with_auth: TestClient) -> None:
+    """Test that the bearer scheme is matched case-insensitively."""
+    response = client_with_auth.get(
+        "/v1/protected/", headers={"Authorization": "bearer test-token-123"}
+    )
+    assert response.status_code == 200
+
+
+def test_bearer_scheme_in_openapi(client_with_auth: TestClient) -> None:
+    """Test that the bearer security scheme is documented in OpenAPI."""
+    schema = client_with_auth.get("/openapi.json").json()
+    assert schema["components"]["securitySchemes"]["HTTPBearer"] == {
+        "type": "http",
+        "scheme": "bearer",
+    }
@@ -2,32 +2,25 @@
 
 import pytest
 from fastapi import HTTPException
-from sqlmodel import Session, select
+from sqlalchemy.pool import NullPool, QueuePool
+from sqlmodel import Session, create_engine, select
 
-from app.core.database import create_db_and_tables, get_session
+from app.core.database import create_db_and_tables, get_pool_capacity, get_session
 from tests.utils.database import create_test_engine, temporary_test_engine
 
 
-def test_database_not_configured() -> None:
+def test_database_not_configured(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that database session raises error when not configured."""
-    # The current app has no DATABASE_URL set by default
-    # So calling get_session should raise an error
     from app.core import database
 
-    # Save current engine
-    original_engine = database.engine
-    try:
-        # Temporarily set engine to None
-        database.engine = None
+    # Temporarily set engine to None; monkeypatch restores it after the test
+    monkeypatch.setattr(database, "engine", None)
 
-        with pytest.raises(HTTPException) as exc_info:
-            next(get_session())
+    with pytest.raises(HTTPException) as exc_info:
+        next(get_session())
 
-        assert exc_info.value.status_code == 500
-        assert "not configured" in exc_info.value.detail.lower()
-    finally:
-        # Restore original engine
-        database.engine = original_engine
+    assert exc_info.value.status_code == 500
+    assert "not configured" in exc_info.value.detail.lower()
 
 
 def test_database_create_tables(db_session: Session) -> None:
@@ -109,9 +102,37 @@ def test_get_session_context_manager() -> None:
 
         # Verify session was yielded
         assert isinstance(session, Session)
+        assert session.autoflush is False
+        assert session.expire_on_commit is False
 
         # Complete the generator (this tests the context manager cleanup)
         try:
             next(gen)
         except StopIteration:
             pass  # Expected
+
+
+def test_get_pool_capacity_queue_pool() -> None:
+    """Test that a bounded QueuePool reports its size plus overflow."""
+    engine = create_engine(
+        "sqlite://", poolclass=QueuePool, pool_size=20, max_overflow=40
+    )
+    assert get_pool_capacity(engine) == 60
+
+
+@pytest.mark.parametrize(
+    "pool_args",
+    [
+        {"poolclass": QueuePool, "max_overflow": -1},
+        {"poolclass": NullPool},
+    ],
+)
+def test_get_pool_capacity_unbounded(pool_args: dict[str, object]) -> None:
+    """Test that unbounded or unpooled engines report no capacity."""
+    engine = create_engine("sqlite://", **pool_args)
+    assert get_pool_capacity(engine) is None
+
+
+def test_get_pool_capacity_static_pool() -> None:
+    """Test that the single-connection SQLite test engine reports no capacity."""
+    assert get_pool_capacity(create_test_engine()) is None
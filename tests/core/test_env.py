@@ -1,6 +1,8 @@
 """Tests for environment variable utilities."""
 
-from app.core.env import get_env_bool, get_env_list, get_env_str
+import os
+
+from app.core.env import clear_env_cache, get_env_bool, get_env_list, get_env_str
 from tests.utils.env import temporary_env_vars
 
 
@@ -89,3 +91,19 @@ def test_get_env_list_custom_separator() -> None:
             "token2",
             "token3",
         ]
+
+
+def test_get_env_cached_until_cleared() -> None:
+    """Test env lookups are cached until clear_env_cache is called."""
+    with temporary_env_vars(TEST_STR="first", TEST_LIST="a,b"):
+        assert get_env_str("TEST_STR") == "first"
+        assert get_env_list("TEST_LIST") == ["a", "b"]
+
+        os.environ["TEST_STR"] = "second"
+        os.environ["TEST_LIST"] = "c"
+        assert get_env_str("TEST_STR") == "first"
+        assert get_env_list("TEST_LIST") == ["a", "b"]
+
+        clear_env_cache()
+        assert get_env_str("TEST_STR") == "second"
+        assert get_env_list("TEST_LIST") == ["c"]
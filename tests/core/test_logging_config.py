@@ -1,21 +1,25 @@
 """Tests for logging configuration."""
 
-import json
 import logging
-import os
 import sys
 from collections.abc import Generator
 from io import StringIO
 from typing import Any
 
+import orjson
 import pytest
 
 from app.core.logging_config import JSONFormatter, get_logger, setup_logging
+from tests.utils.env import temporary_env_vars
+
+# One formatter shared by the tests, as a handler would hold it
+FORMATTER = JSONFormatter()
 
 
 def create_test_log_record(
     level: int = logging.INFO,
     msg: str = "Test message",
+    args: tuple[object, ...] = (),
     exc_info: Any = None,
     **extra_fields: object,
 ) -> logging.LogRecord:
@@ -24,6 +28,7 @@ def create_test_log_record(
     Args:
         level: Log level (default: logging.INFO)
         msg: Log message (default: "Test message")
+        args: Arguments merged into msg with %-formatting (default: ())
         exc_info: Exception info tuple (default: None)
         **extra_fields: Additional fields to add to the record
 
@@ -36,7 +41,7 @@ def create_test_log_record(
         pathname="test.py",
         lineno=10,
         msg=msg,
-        args=(),
+        args=args,
         exc_info=exc_info,
     )
 
@@ -47,6 +52,22 @@ def create_test_log_record(
     return record
 
 
+@pytest.fixture(autouse=True)
+def reset_loggers() -> Generator[None, None, None]:
+    """Restore root and app logger state changed by setup_logging."""
+    root_logger = logging.getLogger()
+    app_logger = logging.getLogger("app")
+    root_handlers = root_logger.handlers[:]
+    root_level = root_logger.level
+    app_level = app_logger.level
+
+    yield
+
+    root_logger.handlers[:] = root_handlers
+    root_logger.setLevel(root_level)
+    app_logger.setLevel(app_level)
+
+
 @pytest.fixture
 def log_stream() -> Generator[StringIO, None, None]:
     """Create a string stream for capturing log output."""
@@ -57,11 +78,10 @@ def log_stream() -> Generator[StringIO, None, None]:
 
 def test_json_formatter_basic() -> None:
     """Test basic JSON formatting of log records."""
-    formatter = JSONFormatter()
     record = create_test_log_record()
 
-    result = formatter.format(record)
-    log_data = json.loads(result)
+    result = FORMATTER.format(record)
+    log_data = orjson.loads(result)
 
     assert log_data["level"] == "INFO"
     assert log_data["logger"] == "test"
@@ -71,10 +91,19 @@ def test_json_formatter_basic() -> None:
     assert "timestamp" in log_data
 
 
+def test_json_formatter_defers_args_formatting() -> None:
+    """Test that the formatter interpolates lazy %-style log arguments."""
+    record = create_test_log_record(msg="user %s did %s", args=("alice", "login"))
+
+    result = FORMATTER.format(record)
+    log_data = orjson.loads(result)
+
+    assert record.msg == "user %s did %s"
+    assert log_data["message"] == "user alice did login"
+
+
 def test_json_formatter_with_exception() -> None:
     """Test JSON formatting with exception info."""
-    formatter = JSONFormatter()
-
     try:
         raise ValueError("Test error")
     except ValueError:
@@ -82,8 +111,8 @@ def test_json_formatter_with_exception() -> None:
             level=logging.ERROR, msg="Error occurred", exc_info=sys.exc_info()
         )
 
-    result = formatter.format(record)
-    log_data = json.loads(result)
+    result = FORMATTER.format(record)
+    log_data = orjson.loads(result)
 
     assert log_data["level"] == "ERROR"
     assert log_data["message"] == "Error occurred"
@@ -95,8 +124,8 @@ def test_json_formatter_with_exception() -> None:
 
 def test_setup_logging_default_level() -> None:
     """Test logging setup with default INFO level."""
-    os.environ.pop("LOG_LEVEL", None)
-    logger = setup_logging()
+    with temporary_env_vars(LOG_LEVEL=None):
+        logger = setup_logging()
 
     assert logger.name == "app"
     assert logger.level == logging.INFO
@@ -104,14 +133,10 @@ def test_setup_logging_default_level() -> None:
 
 def test_setup_logging_custom_level() -> None:
     """Test logging setup with custom log level."""
-    os.environ["LOG_LEVEL"] = "DEBUG"
-    logger = setup_logging()
-
-    assert logger.level == logging.DEBUG
+    with temporary_env_vars(LOG_LEVEL="DEBUG"):
+        logger = setup_logging()
 
-    # Clean up
-    os.environ.pop("LOG_LEVEL", None)
-    setup_logging()  # Reset to default
+        assert logger.level == logging.DEBUG
 
 
 def test_get_logger() -> None:
@@ -130,9 +155,10 @@ def test_logger_json_output(log_stream: StringIO) -> None:
     logger.setLevel(logging.INFO)
 
     logger.info("Test message")
+    logger.removeHandler(handler)
 
     output = log_stream.getvalue()
-    log_data = json.loads(output.strip())
+    log_data = orjson.loads(output.strip())
 
     assert log_data["message"] == "Test message"
     assert log_data["level"] == "INFO"
@@ -140,12 +166,28 @@ def test_logger_json_output(log_stream: StringIO) -> None:
 
 def test_json_formatter_with_extra_fields() -> None:
     """Test JSON formatting with extra fields."""
-    formatter = JSONFormatter()
     record = create_test_log_record(user_id=123, request_id="abc-123")
 
-    result = formatter.format(record)
-    log_data = json.loads(result)
+    result = FORMATTER.format(record)
+    log_data = orjson.loads(result)
 
     assert log_data["message"] == "Test message"
     assert log_data["user_id"] == 123
     assert log_data["request_id"] == "abc-123"
+
+
+def test_json_formatter_non_str_keys() -> None:
+    """Test that extra fields with non-string keys are serialized."""
+    record = create_test_log_record(status_counts={200: 3, 404: 1})
+
+    log_data = orjson.loads(FORMATTER.format(record))
+
+    assert log_data["status_counts"] == {"200": 3, "404": 1}
+
+
+def test_setup_logging_idempotent() -> None:
+    """Test that repeated setup keeps a single root handler."""
+    setup_logging()
+    setup_logging()
+
+    assert len(logging.getLogger().handlers) == 1
@@ -0,0 +1,37 @@
+"""Tests for project metadata."""
+
+from email.message import Message
+from importlib.metadata import PackageNotFoundError
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import tomllib
+
+from app.core.metadata import _load_metadata  # pyright: ignore[reportPrivateUsage]
+
+
+@patch("app.core.metadata.metadata")
+def test_load_metadata_from_distribution(mock_metadata: MagicMock) -> None:
+    """Test that installed distribution metadata is preferred."""
+    dist = Message()
+    dist["Name"] = "dist-name"
+    dist["Version"] = "1.2.3"
+    dist["Summary"] = "Dist summary"
+    mock_metadata.return_value = dist
+
+    assert _load_metadata() == ("dist-name", "1.2.3", "Dist summary")
+
+
+@patch("app.core.metadata.metadata")
+def test_load_metadata_from_pyproject(mock_metadata: MagicMock) -> None:
+    """Test fallback to pyproject.toml when the distribution is not installed."""
+    mock_metadata.side_effect = PackageNotFoundError
+    pyproject_path = Path(__file__).parent.parent.parent / "pyproject.toml"
+    with open(pyproject_path, "rb") as f:
+        project = tomllib.load(f)["project"]
+
+    assert _load_metadata() == (
+        project["name"],
+        project["version"],
+        project["description"],
+    )
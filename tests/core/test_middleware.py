@@ -0,0 +1,68 @@
+"""Tests for ASGI middleware."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import middleware
+from app.core.middleware import RequestLoggingMiddleware
+
+
+def create_ping_app(excluded_paths: set[str] | None = None) -> FastAPI:
+    """Create a test app with the request logging middleware."""
+    test_app = FastAPI()
+    test_app.add_middleware(
+        RequestLoggingMiddleware, excluded_paths=excluded_paths or ()
+    )
+
+    @test_app.get("/ping")
+    def ping() -> dict[str, str]:  # pyright: ignore[reportUnusedFunction]
+        return {"ping": "pong"}
+
+    @test_app.get("/pong")
+    def pong() -> dict[str, str]:  # pyright: ignore[reportUnusedFunction]
+        return {"pong": "ping"}
+
+    return test_app
+
+
+def test_request_logging_middleware(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that requests and response status codes are logged."""
+    with caplog.at_level("INFO", logger="app"):
+        response = TestClient(create_ping_app()).get("/ping")
+
+    assert response.status_code == 200
+    messages = [record.getMessage() for record in caplog.records]
+    assert "GET /ping" in messages
+    assert "GET /ping - Status: 200" in messages
+
+
+def test_request_logging_middleware_disabled_above_info(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that nothing is logged when INFO is filtered out."""
+    with caplog.at_level("WARNING", logger="app"):
+        response = TestClient(create_ping_app()).get("/ping")
+
+    assert response.status_code == 200
+    assert response.json() == {"ping": "pong"}
+    assert caplog.records == []
+
+
+def test_request_logging_middleware_excluded_paths(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that excluded paths are not logged while other paths still are."""
+    with caplog.at_level("INFO", logger="app"):
+        client = TestClient(create_ping_app({"/ping"}))
+        excluded_response = client.get("/ping")
+        included_response = client.get("/pong")
+
+    assert excluded_response.status_code == 200
+    assert included_response.status_code == 200
+    messages = [
+        record.getMessage()
+        for record in caplog.records
+        if record.name == middleware.logger.name
+    ]
+    assert messages == ["GET /pong", "GET /pong - Status: 200"]
@@ -2,86 +2,127 @@
 
 import os
 from collections.abc import Generator
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
+from opentelemetry.util.http import parse_excluded_urls
 
+from app.core.env import clear_env_cache
 from app.core.otel import (
+    EXCLUDED_URLS,
+    get_excluded_urls,
     get_otel_endpoint,
     get_service_name,
     is_otel_enabled,
     setup_opentelemetry,
 )
-from tests.utils.env import clean_env_vars
 
 
-@pytest.fixture
-def clean_env() -> Generator[None, None, None]:
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
     """Clean up OpenTelemetry environment variables."""
-    with clean_env_vars(
-        "OTEL_ENABLED", "OTEL_SERVICE_NAME", "OTEL_EXPORTER_OTLP_ENDPOINT"
+    for key in (
+        "OTEL_ENABLED",
+        "OTEL_SERVICE_NAME",
+        "OTEL_EXPORTER_OTLP_ENDPOINT",
+        "OTEL_TRACES_SAMPLER",
+        "OTEL_TRACES_SAMPLER_ARG",
+        "OTEL_PYTHON_FASTAPI_EXCLUDED_URLS",
+        "OTEL_PYTHON_EXCLUDED_URLS",
     ):
-        yield
+        monkeypatch.delenv(key, raising=False)
+    clear_env_cache()
+    yield
+    clear_env_cache()
 
 
-def test_is_otel_enabled_default(clean_env: None) -> None:  # noqa: ARG001
+def test_is_otel_enabled_default() -> None:
     """Test that OpenTelemetry is disabled by default."""
     assert is_otel_enabled() is False
 
 
-def test_is_otel_enabled_true(clean_env: None) -> None:  # noqa: ARG001
-    """Test that OpenTelemetry is enabled when env var is 'true'."""
-    os.environ["OTEL_ENABLED"] = "true"
+@pytest.mark.parametrize("value", ["true", "TRUE", "True"])
+def test_is_otel_enabled_true(monkeypatch: pytest.MonkeyPatch, value: str) -> None:
+    """Test that OpenTelemetry is enabled when env var is 'true' in any case."""
+    monkeypatch.setenv("OTEL_ENABLED", value)
     assert is_otel_enabled() is True
 
 
-def test_is_otel_enabled_true_case_insensitive(clean_env: None) -> None:  # noqa: ARG001
-    """Test that OTEL_ENABLED is case-insensitive."""
-    os.environ["OTEL_ENABLED"] = "TRUE"
-    assert is_otel_enabled() is True
+def test_is_otel_enabled_cached() -> None:
+    """Test that OTEL_ENABLED is read from the environment only once."""
+    with patch("app.core.env.os.getenv", wraps=os.getenv) as mock_getenv:
+        for _ in range(100):
+            is_otel_enabled()
 
-    os.environ["OTEL_ENABLED"] = "True"
-    assert is_otel_enabled() is True
+    mock_getenv.assert_called_once_with("OTEL_ENABLED", "")
 
 
-def test_is_otel_enabled_false(clean_env: None) -> None:  # noqa: ARG001
+@pytest.mark.parametrize("value", ["false", "1", "yes"])
+def test_is_otel_enabled_false(monkeypatch: pytest.MonkeyPatch, value: str) -> None:
     """Test that OpenTelemetry is disabled when env var is not 'true'."""
-    os.environ["OTEL_ENABLED"] = "false"
+    monkeypatch.setenv("OTEL_ENABLED", value)
     assert is_otel_enabled() is False
 
-    os.environ["OTEL_ENABLED"] = "1"
-    assert is_otel_enabled() is False
 
-    os.environ["OTEL_ENABLED"] = "yes"
-    assert is_otel_enabled() is False
-
-
-def test_get_service_name_default(clean_env: None) -> None:  # noqa: ARG001
+def test_get_service_name_default() -> None:
     """Test that service name defaults to 'python-microservice-template'."""
     assert get_service_name() == "python-microservice-template"
 
 
-def test_get_service_name_custom(clean_env: None) -> None:  # noqa: ARG001
+def test_get_service_name_custom(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that custom service name is used when env var is set."""
-    os.environ["OTEL_SERVICE_NAME"] = "my-custom-service"
+    monkeypatch.setenv("OTEL_SERVICE_NAME", "my-custom-service")
     assert get_service_name() == "my-custom-service"
 
 
-def test_get_otel_endpoint_default(clean_env: None) -> None:  # noqa: ARG001
+def test_get_otel_endpoint_default() -> None:
     """Test that OTLP endpoint is None by default."""
     assert get_otel_endpoint() is None
 
 
-def test_get_otel_endpoint_custom(clean_env: None) -> None:  # noqa: ARG001
+def test_get_otel_endpoint_custom(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that custom OTLP endpoint is used when env var is set."""
-    os.environ["OTEL_EXPORTER_OTLP_ENDPOINT"] = "http://localhost:4317"
+    monkeypatch.setenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
     assert get_otel_endpoint() == "http://localhost:4317"
 
 
+@pytest.mark.parametrize(
+    ("url", "excluded"),
+    [
+        ("http://testserver/", True),
+        ("http://testserver/docs", True),
+        ("http://testserver/docs/oauth2-redirect", True),
+        ("http://testserver/redoc", True),
+        ("http://testserver/openapi.json", True),
+        ("http://testserver/v1/users/", False),
+        ("http://testserver/v1/items/", False),
+        ("http://testserver/docsx", False),
+        ("http://testserver/redocument", False),
+        ("http://testserver/openapi.jsonfoo", False),
+    ],
+)
+def test_excluded_urls(url: str, excluded: bool) -> None:
+    """Test that only the healthcheck and docs URLs are excluded from tracing."""
+    assert parse_excluded_urls(EXCLUDED_URLS).url_disabled(url) is excluded
+
+
+def test_get_excluded_urls_default() -> None:
+    """Test that the healthcheck and docs are excluded by default."""
+    assert get_excluded_urls() == EXCLUDED_URLS
+
+
+@pytest.mark.parametrize(
+    "key", ["OTEL_PYTHON_FASTAPI_EXCLUDED_URLS", "OTEL_PYTHON_EXCLUDED_URLS"]
+)
+def test_get_excluded_urls_from_env(monkeypatch: pytest.MonkeyPatch, key: str) -> None:
+    """Test that the standard excluded URL variables are left to the instrumentor."""
+    monkeypatch.setenv(key, "healthz")
+    assert get_excluded_urls() is None
+
+
 @patch("app.core.otel.logger")
 def test_setup_opentelemetry_disabled(
     mock_logger: MagicMock,
-    clean_env: None,  # noqa: ARG001
 ) -> None:
     """Test that setup does nothing when OpenTelemetry is disabled."""
     setup_opentelemetry()
@@ -91,10 +132,10 @@ def test_setup_opentelemetry_disabled(
 @patch("app.core.otel.logger")
 def test_setup_opentelemetry_no_endpoint(
     mock_logger: MagicMock,
-    clean_env: None,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that setup warns when enabled but no endpoint is configured."""
-    os.environ["OTEL_ENABLED"] = "true"
+    monkeypatch.setenv("OTEL_ENABLED", "true")
     setup_opentelemetry()
 
     assert mock_logger.warning.call_count == 1
@@ -109,28 +150,48 @@ def test_setup_opentelemetry_with_endpoint(
     mock_logger: MagicMock,
     mock_set_tracer: MagicMock,
     mock_set_meter: MagicMock,
-    clean_env: None,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that OpenTelemetry is properly initialized with endpoint."""
-    os.environ["OTEL_ENABLED"] = "true"
-    os.environ["OTEL_EXPORTER_OTLP_ENDPOINT"] = "http://localhost:4317"
-    os.environ["OTEL_SERVICE_NAME"] = "test-service"
+    monkeypatch.setenv("OTEL_ENABLED", "true")
+    monkeypatch.setenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
+    monkeypatch.setenv("OTEL_SERVICE_NAME", "test-service")
 
     setup_opentelemetry()
 
     # Verify logger calls
-    assert mock_logger.info.call_count == 2
-    assert "Initializing OpenTelemetry for service: test-service" in str(
-        mock_logger.info.call_args_list[0]
-    )
-    assert "OpenTelemetry initialized with endpoint: http://localhost:4317" in str(
-        mock_logger.info.call_args_list[1]
-    )
+    assert mock_logger.info.call_args_list == [
+        call("Initializing OpenTelemetry for service: %s", "test-service"),
+        call("OpenTelemetry initialized with endpoint: %s", "http://localhost:4317"),
+    ]
 
     # Verify providers were set
     mock_set_tracer.assert_called_once()
     mock_set_meter.assert_called_once()
 
+    # Verify the SDK's default sampler is kept
+    sampler = mock_set_tracer.call_args[0][0].sampler
+    assert sampler.get_description().startswith("ParentBased{root:AlwaysOnSampler")
+
+
+@patch("app.core.otel.metrics.set_meter_provider")
+@patch("app.core.otel.trace.set_tracer_provider")
+def test_setup_opentelemetry_sampler_from_env(
+    mock_set_tracer: MagicMock,
+    _mock_set_meter: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the standard OTEL_TRACES_SAMPLER variables configure sampling."""
+    monkeypatch.setenv("OTEL_ENABLED", "true")
+    monkeypatch.setenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
+    monkeypatch.setenv("OTEL_TRACES_SAMPLER", "parentbased_traceidratio")
+    monkeypatch.setenv("OTEL_TRACES_SAMPLER_ARG", "0.05")
+
+    setup_opentelemetry()
+
+    sampler = mock_set_tracer.call_args[0][0].sampler
+    assert "TraceIdRatioBased{0.05}" in sampler.get_description()
+
 
 @patch("app.core.otel.metrics.set_meter_provider")
 @patch("app.core.otel.trace.set_tracer_provider")
@@ -139,16 +200,15 @@ def test_setup_opentelemetry_default_service_name(
     mock_logger: MagicMock,
     _mock_set_tracer: MagicMock,
     _mock_set_meter: MagicMock,
-    clean_env: None,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test that OpenTelemetry uses default service name when not specified."""
-    os.environ["OTEL_ENABLED"] = "true"
-    os.environ["OTEL_EXPORTER_OTLP_ENDPOINT"] = "http://localhost:4317"
+    monkeypatch.setenv("OTEL_ENABLED", "true")
+    monkeypatch.setenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
 
     setup_opentelemetry()
 
     # Verify default service name is used
-    assert (
-        "Initializing OpenTelemetry for service: python-microservice-template"
-        in str(mock_logger.info.call_args_list[0])
+    assert mock_logger.info.call_args_list[0] == call(
+        "Initializing OpenTelemetry for service: %s", "python-microservice-template"
     )
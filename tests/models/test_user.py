@@ -0,0 +1,19 @@
+"""Tests for the User model."""
+
+from typing import cast
+
+from sqlalchemy import Table, inspect
+
+from app.models.user import User
+
+
+def test_user_email_and_username_have_unique_indexes() -> None:
+    """Test that duplicate checks can rely on DB-side unique indexes."""
+    table = cast(Table, inspect(User).local_table)
+    indexes = {
+        tuple(column.name for column in index.columns): index.unique
+        for index in table.indexes
+    }
+
+    assert indexes[("email",)] is True
+    assert indexes[("username",)] is True
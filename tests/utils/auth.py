@@ -1,23 +1,51 @@
 """Auth test utilities for managing authentication tokens in tests."""
 
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import Set
+from contextlib import AbstractContextManager
+from types import TracebackType
 from typing import Any
 
+from tests.utils.context import NULL_CONTEXT
+
+
+class TemporaryValidTokens:
+    """Context manager that swaps VALID_API_KEY_HASHES and restores it on exit."""
+
+    __slots__ = ("_auth_module", "_hashes", "_original_hashes")
+
+    def __init__(self, auth_module: Any, tokens: Set[str] | None) -> None:
+        self._auth_module = auth_module
+        self._hashes = frozenset(
+            auth_module.hash_api_key(token) for token in tokens or ()
+        )
+        self._original_hashes: frozenset[bytes] = frozenset()
+
+    def __enter__(self) -> None:
+        self._original_hashes = self._auth_module.VALID_API_KEY_HASHES
+        self._auth_module.VALID_API_KEY_HASHES = self._hashes
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._auth_module.VALID_API_KEY_HASHES = self._original_hashes
+
 
-@contextmanager
 def temporary_valid_tokens(
-    auth_module: Any, tokens: set[str] | None
-) -> Generator[None, None, None]:
+    auth_module: Any, tokens: Set[str] | None
+) -> AbstractContextManager[None]:
     """
-    Context manager that temporarily overrides VALID_API_KEYS.
+    Context manager that temporarily overrides VALID_API_KEY_HASHES.
 
     Args:
-        auth_module: The module containing VALID_API_KEYS to override (e.g., app.core.auth)
-        tokens: Set of tokens to use, or None to clear all tokens
+        auth_module: The module containing VALID_API_KEY_HASHES to override (e.g., app.core.auth)
+        tokens: Set or frozenset of tokens to use, or None to clear all tokens
 
-    Yields:
-        None
+    Returns:
+        Context manager that restores the original hashes on exit, or a
+        no-op one when clearing tokens that are already cleared
 
     Example:
         with temporary_valid_tokens(auth, {"test-token"}):
@@ -26,16 +54,9 @@ def temporary_valid_tokens(
         with temporary_valid_tokens(auth, None):
             # ... run tests with authentication disabled ...
     """
-    original_tokens = auth_module.VALID_API_KEYS.copy()
-
-    try:
-        auth_module.VALID_API_KEYS.clear()
-        if tokens is not None:
-            auth_module.VALID_API_KEYS.update(tokens)
-        yield
-    finally:
-        auth_module.VALID_API_KEYS.clear()
-        auth_module.VALID_API_KEYS.update(original_tokens)
+    if not tokens and not auth_module.VALID_API_KEY_HASHES:
+        return NULL_CONTEXT
+    return TemporaryValidTokens(auth_module, tokens)
 
 
 def create_auth_header(token: str) -> dict[str, str]:
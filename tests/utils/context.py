@@ -0,0 +1,6 @@
+"""Shared context manager test utilities."""
+
+from contextlib import AbstractContextManager, nullcontext
+
+# Returned by test helpers when there is nothing to swap or restore
+NULL_CONTEXT: AbstractContextManager[None] = nullcontext()
@@ -1,11 +1,18 @@
 """Database test utilities for managing test database engines and sessions."""
 
+import os
 from collections.abc import Generator
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any
 
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
+# SQLite connect args shared by every test engine
+_CONNECT_ARGS = {"check_same_thread": False}
+
 
 def create_test_engine() -> Any:
     """
@@ -15,15 +22,43 @@ def create_test_engine() -> Any:
         Engine configured for in-memory SQLite database with:
         - connect_args for check_same_thread=False
         - poolclass=StaticPool for connection pooling
+        - transactions emitted by SQLAlchemy so SAVEPOINT rollbacks work
+        - journaling and syncing kept in memory, since nothing is persisted
     """
-    from sqlalchemy.pool import StaticPool
-
-    return create_engine(
+    engine = create_engine(
         "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
+        connect_args=_CONNECT_ARGS,
         poolclass=StaticPool,
     )
 
+    @event.listens_for(engine, "connect")
+    def _configure_connection(dbapi_connection: Any, _record: Any) -> None:  # pyright: ignore[reportUnusedFunction]
+        # pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy do it
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection: Any) -> None:  # pyright: ignore[reportUnusedFunction]
+        connection.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+@lru_cache(maxsize=1)
+def _shared_test_engine(_pid: int) -> Any:
+    """Return the test engine shared by temporary_test_engine calls.
+
+    The schema is created once, when the engine is first requested. Keyed
+    by process id so a forked worker builds its own engine.
+    """
+    engine = create_test_engine()
+    SQLModel.metadata.create_all(engine)
+    return engine
+
 
 @contextmanager
 def temporary_test_engine(
@@ -32,6 +67,9 @@ def temporary_test_engine(
     """
     Context manager that temporarily overrides a database module's engine.
 
+    The engine and its tables are shared across calls, so no DDL runs per use.
+    Rows written inside the block are deleted on exit.
+
     Args:
         database_module: The module containing the engine to override (e.g., app.core.database)
 
@@ -40,32 +78,75 @@ def temporary_test_engine(
 
     Example:
         with temporary_test_engine(database) as engine:
-            SQLModel.metadata.create_all(engine)
-            # ... run tests ...
+            # Tables already exist; rows written here are deleted on exit
+            with Session(engine) as session:
+                # ... run tests ...
     """
     original_engine = database_module.engine
-    test_engine = create_test_engine()
+    test_engine = _shared_test_engine(os.getpid())
 
     try:
         database_module.engine = test_engine
-        SQLModel.metadata.create_all(test_engine)
         yield test_engine
     finally:
         database_module.engine = original_engine
-        if test_engine is not None:
-            SQLModel.metadata.drop_all(test_engine)
-            test_engine.dispose()
+        # Empty the tables instead of dropping them so the schema stays warm
+        with test_engine.begin() as connection:
+            for table in reversed(SQLModel.metadata.sorted_tables):
+                connection.execute(table.delete())
 
 
-def get_test_session(engine: Any) -> Generator[Session, None, None]:
+@contextmanager
+def transactional_test_session(engine: Any) -> Generator[Session, None, None]:
+    """
+    Context manager yielding a session whose writes are rolled back on exit.
+
+    The session joins an outer transaction on a single connection, so commits
+    in the code under test only release a SAVEPOINT and no DDL runs per use.
+
+    Args:
+        engine: SQLAlchemy engine whose schema already exists
+
+    Yields:
+        SQLModel Session bound to the outer transaction
+
+    Example:
+        @pytest.fixture(scope="session")
+        def db_engine() -> Generator[Engine, None, None]:
+            engine = create_test_engine()
+            SQLModel.metadata.create_all(engine)
+            yield engine
+            engine.dispose()
+
+        @pytest.fixture
+        def db_session(db_engine: Engine) -> Generator[Session, None, None]:
+            with transactional_test_session(db_engine) as session:
+                yield session
+    """
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        # Match SessionLocal so committed objects keep their loaded attributes
+        with Session(
+            bind=connection,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+        ) as session:
+            yield session
+        transaction.rollback()
+
+
+def get_test_session(engine: Any) -> Session:
     """
     Create a test database session from an engine.
 
     Args:
         engine: SQLAlchemy engine to create session from
 
-    Yields:
-        SQLModel Session instance
+    Returns:
+        SQLModel Session instance, to be used as a context manager
+
+    Example:
+        with get_test_session(engine) as session:
+            # ... run queries ...
     """
-    with Session(engine) as session:
-        yield session
+    return Session(engine)
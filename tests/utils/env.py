@@ -1,20 +1,65 @@
 """Environment variable test utilities for managing test environment configuration."""
 
 import os
-from collections.abc import Generator
-from contextlib import contextmanager
+from types import TracebackType
 
+from app.core.env import clear_env_cache
 
-@contextmanager
-def temporary_env_vars(**env_vars: str | None) -> Generator[None, None, None]:
+
+class TemporaryEnvVars:
+    """Context manager that sets or deletes environment variables, then restores them.
+
+    Cached lookups from app.core.env are cleared on entry and exit.
+    """
+
+    __slots__ = ("_env_vars", "_original_values")
+
+    def __init__(self, env_vars: dict[str, str | None]) -> None:
+        self._env_vars = env_vars
+        self._original_values: dict[str, str | None] = {}
+
+    def __enter__(self) -> None:
+        environ = os.environ
+
+        # Save original values and set new ones
+        self._original_values = {key: environ.get(key) for key in self._env_vars}
+        for key, value in self._env_vars.items():
+            if value is None:
+                environ.pop(key, None)
+            else:
+                environ[key] = value
+        clear_env_cache()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        environ = os.environ
+
+        # Restore original values, skipping any that are already in place
+        for key, original_value in self._original_values.items():
+            if environ.get(key) == original_value:
+                continue
+            if original_value is None:
+                environ.pop(key, None)
+            else:
+                environ[key] = original_value
+        clear_env_cache()
+
+
+def temporary_env_vars(**env_vars: str | None) -> TemporaryEnvVars:
     """
     Context manager that temporarily sets environment variables.
 
+    Cached lookups from app.core.env are cleared on entry and exit.
+
     Args:
         **env_vars: Environment variables to set (name=value). Use None to delete a variable.
 
-    Yields:
-        None
+    Returns:
+        Context manager that restores the original values on exit
 
     Example:
         with temporary_env_vars(LOG_LEVEL="DEBUG", DATABASE_URL=None):
@@ -22,37 +67,20 @@ def temporary_env_vars(**env_vars: str | None) -> Generator[None, None, None]:
             # ... run tests ...
         # Original values are restored
     """
-    original_values: dict[str, str | None] = {}
-
-    # Save original values and set new ones
-    for key, value in env_vars.items():
-        original_values[key] = os.environ.get(key)
-        if value is None:
-            os.environ.pop(key, None)
-        else:
-            os.environ[key] = value
-
-    try:
-        yield
-    finally:
-        # Restore original values
-        for key, original_value in original_values.items():
-            if original_value is None:
-                os.environ.pop(key, None)
-            else:
-                os.environ[key] = original_value
+    return TemporaryEnvVars(env_vars)
 
 
-@contextmanager
-def clean_env_vars(*var_names: str) -> Generator[None, None, None]:
+def clean_env_vars(*var_names: str) -> TemporaryEnvVars:
     """
     Context manager that temporarily removes specific environment variables.
 
+    Cached lookups from app.core.env are cleared on entry and exit.
+
     Args:
         *var_names: Names of environment variables to remove
 
-    Yields:
-        None
+    Returns:
+        Context manager that restores the original values on exit
 
     Example:
         with clean_env_vars("OTEL_ENABLED", "OTEL_EXPORTER_OTLP_ENDPOINT"):
@@ -60,17 +88,4 @@ def clean_env_vars(*var_names: str) -> Generator[None, None, None]:
             # ... run tests ...
         # Original values are restored
     """
-    original_values: dict[str, str | None] = {}
-
-    # Save original values and remove variables
-    for var_name in var_names:
-        original_values[var_name] = os.environ.get(var_name)
-        os.environ.pop(var_name, None)
-
-    try:
-        yield
-    finally:
-        # Restore original values
-        for var_name, original_value in original_values.items():
-            if original_value is not None:
-                os.environ[var_name] = original_value
+    return TemporaryEnvVars(dict.fromkeys(var_names))